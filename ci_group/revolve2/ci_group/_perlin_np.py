@@ -0,0 +1,100 @@
+"""Vectorized 2D Perlin noise for terrain heightmap generation."""
+
+import numpy as np
+import numpy.typing as npt
+
+_PERM = np.tile(np.random.RandomState(0).permutation(256).astype(np.int32), 2)
+"""Doubled Perlin permutation table, fixed seed so terrains are reproducible."""
+
+_GX = np.array([1, -1, 1, -1, 1, -1, 0, 0], dtype=np.float32)
+_GY = np.array([0, 0, 1, 1, -1, -1, 1, -1], dtype=np.float32)
+"""The eight lattice gradients as separate x/y component tables."""
+
+
+def _fade(t: npt.NDArray[np.float32]) -> npt.NDArray[np.float32]:
+    """
+    Apply Perlin's quintic smoothstep to interpolation weights.
+
+    :param t: The fractional lattice coordinates.
+    :returns: The smoothed weights.
+    """
+    return t * t * t * (t * (t * 6.0 - 15.0) + 10.0)
+
+
+def _grad(
+    hashes: npt.NDArray[np.int_],
+    xf: npt.NDArray[np.float32],
+    yf: npt.NDArray[np.float32],
+) -> npt.NDArray[np.float32]:
+    """
+    Compute the dot product of lattice gradients with the offset vectors.
+
+    :param hashes: The permutation hash of each lattice corner.
+    :param xf: The x offsets from the lattice corner.
+    :param yf: The y offsets from the lattice corner.
+    :returns: The gradient contributions.
+    """
+    h = hashes & 7
+    contributions: npt.NDArray[np.float32] = _GX[h] * xf + _GY[h] * yf
+    return contributions
+
+
+def _perlin2d(
+    sx: npt.NDArray[np.float32], sy: npt.NDArray[np.float32]
+) -> npt.NDArray[np.float32]:
+    """
+    Evaluate one octave of 2D Perlin noise on arrays of sample coordinates.
+
+    :param sx: The x sample coordinates.
+    :param sy: The y sample coordinates.
+    :returns: The noise values, one per coordinate pair.
+    """
+    x0 = np.floor(sx)
+    y0 = np.floor(sy)
+    xf = sx - x0
+    yf = sy - y0
+    xi = x0.astype(np.int64) & 255
+    yi = y0.astype(np.int64) & 255
+
+    h00 = _PERM[_PERM[xi] + yi]
+    h01 = _PERM[_PERM[xi] + yi + 1]
+    h10 = _PERM[_PERM[xi + 1] + yi]
+    h11 = _PERM[_PERM[xi + 1] + yi + 1]
+
+    n00 = _grad(h00, xf, yf)
+    n10 = _grad(h10, xf - 1.0, yf)
+    n01 = _grad(h01, xf, yf - 1.0)
+    n11 = _grad(h11, xf - 1.0, yf - 1.0)
+
+    u = _fade(xf)
+    v = _fade(yf)
+    nx0 = n00 + u * (n10 - n00)
+    nx1 = n01 + u * (n11 - n01)
+    return nx0 + v * (nx1 - nx0)
+
+
+def perlin2d_grid(
+    sx: npt.NDArray[np.float32],
+    sy: npt.NDArray[np.float32],
+    octaves: int,
+) -> npt.NDArray[np.float32]:
+    """
+    Evaluate fractal (octave-summed) 2D Perlin noise on a coordinate grid.
+
+    Octaves follow the usual fractional Brownian motion convention:
+    each octave doubles the frequency and halves the amplitude.
+    The result is roughly within [-1, 1] but not exactly.
+
+    :param sx: The x sample coordinates.
+    :param sy: The y sample coordinates.
+    :param octaves: How many octaves to sum.
+    :returns: The noise values, one per coordinate pair.
+    """
+    total = np.zeros(np.broadcast_shapes(sx.shape, sy.shape), dtype=sx.dtype)
+    frequency = 1.0
+    amplitude = 1.0
+    for _ in range(octaves):
+        total += amplitude * _perlin2d(sx * frequency, sy * frequency)
+        frequency *= 2.0
+        amplitude *= 0.5
+    return total
@@ -1,12 +1,18 @@
 """Standard terrains."""
 
-import math
+import functools
 
 import numpy as np
 import numpy.typing as npt
-from noise import pnoise2
 from pyrr import Vector3
 
+from ._perlin_np import perlin2d_grid
+
+try:
+    from . import _perlin_numba
+except ImportError:
+    _perlin_numba = None  # type: ignore[assignment]
+
 from revolve2.modular_robot_simulation import Terrain
 from revolve2.simulation.scene import Pose, Color
 from revolve2.simulation.scene.geometry import GeometryHeightmap, GeometryPlane
@@ -14,20 +20,66 @@ from revolve2.simulation.scene.vector2 import Vector2
 from revolve2.simulators.mujoco_simulator.textures import Checker
 from revolve2.simulation.scene.geometry.textures import MapType
 
+_OCTAVE = 10
+"""How many noise octaves the rugged heightmap sums."""
+
+_C1 = 4.0
+"""Arbitrary noise coordinate scale to get nice ruggedness."""
+
+_CHECKER_TEXTURE = Checker(
+    primary_color=Color(170, 170, 180, 255),
+    secondary_color=Color(150, 150, 150, 255),
+    map_type=MapType.MAP2D,
+)
+"""Shared checker texture for the textured tile of the mixed terrain."""
+
+_NUM_EDGES = 100
+"""Arbitrary number of heightmap edges per unit of terrain size to get a nice resolution."""
+
+
+def _num_edges(
+    size: tuple[float, float], granularity_multiplier: float
+) -> tuple[int, int]:
+    """
+    Compute the heightmap grid resolution for a terrain.
+
+    :param size: Size of the terrain.
+    :param granularity_multiplier: Multiplier for the number of edges.
+    :returns: The number of edges along each axis.
+    """
+    return (
+        int(_NUM_EDGES * size[0] * granularity_multiplier),
+        int(_NUM_EDGES * size[1] * granularity_multiplier),
+    )
+
 
 def flat(size: Vector2 = Vector2([20.0, 20.0])) -> Terrain:
     """
     Create a flat plane terrain.
 
+    Calls with equal sizes share a single Terrain instance, as the
+    terrain is never mutated after creation.
+
     :param size: Size of the plane.
     :returns: The created terrain.
     """
+    return _flat_cached((size[0], size[1]))
+
+
+@functools.cache
+def _flat_cached(size: tuple[float, float]) -> Terrain:
+    """
+    Build the flat terrain for the given plane size.
+
+    :param size: Size of the plane.
+    :returns: The created terrain, shared between calls.
+    """
     return Terrain(
         static_geometry=[
             GeometryPlane(
                 pose=Pose(),
                 mass=0.0,
-                size=size,
+                size=Vector2([size[0], size[1]]),
             )
         ]
     )
@@ -46,12 +98,7 @@ def flat_rugged(
     :param granularity_multiplier: Multiplier for the number of edges used in the heightmap.
     :returns: The created terrain.
     """
-    NUM_EDGES = 100  # arbitrary constant following the crater terrain
-
-    num_edges = (
-        int(NUM_EDGES * size[0] * granularity_multiplier),
-        int(NUM_EDGES * size[1] * granularity_multiplier),
-    )
+    num_edges = _num_edges(size, granularity_multiplier)
 
     heights = rugged_heightmap(
         size=size,
@@ -89,14 +136,7 @@ def mixed_terrain(
     :param granularity_multiplier: Multiplier for the number of edges used in the heightmap.
     :returns: The created terrain.
     """
-    NUM_EDGES = 100  # arbitrary constant following the crater terrain
-
-    num_edges = (
-        int(NUM_EDGES * size[0] * granularity_multiplier),
-        int(NUM_EDGES * size[1] * granularity_multiplier),
-    )
-
-    # print("Num Edges:", num_edges)
+    num_edges = _num_edges(size, granularity_multiplier)
 
     rugged_heights = rugged_heightmap(
         size=size,
@@ -104,12 +144,9 @@ def mixed_terrain(
         density=1.0,
     )
 
-    flat_heights = np.zeros_like(rugged_heights)
-
-    # print("Rugged heightmap shape:", rugged_heights.shape)
-    # print("Rugged heightmap min", rugged_heights.min())
-    # print("Rugged heightmap max", rugged_heights.max())
-    # print("Flat heightmap shape:", flat_heights.shape)
+    # A flat tile does not need the full grid resolution; a 2x2 field
+    # (the minimum MuJoCo heightfield) describes it exactly.
+    flat_heights = np.zeros((2, 2), dtype=np.float32)
 
     # Scale the ruggedness to maintain overall flatness
     max_height = ruggedness
@@ -118,7 +155,7 @@ def mixed_terrain(
     return Terrain(
         static_geometry=[
             GeometryHeightmap(
-                pose=Pose(Vector3([0, 0, 0])),
+                pose=Pose(),
                 mass=0.0,
                 size=Vector3([size[0], size[1], max_height]),
                 base_thickness=0.1,
@@ -130,11 +167,7 @@ def mixed_terrain(
                 size=Vector3([size[0], size[1], max_height]),
                 base_thickness=0.1,
                 heights=flat_heights,
-                texture=Checker(
-                    primary_color=Color(170, 170, 180, 255),
-                    secondary_color=Color(150, 150, 150, 255),
-                    map_type=MapType.MAP2D,
-                ),
+                texture=_CHECKER_TEXTURE,
             ),
             GeometryHeightmap(
                 pose=Pose(Vector3([4 * size[0], 0, 0])),
@@ -160,26 +193,20 @@ def mixed_flat_rugged(
     :param granularity_multiplier: Multiplier for the number of edges used in the heightmap.
     :returns: The created terrain.
     """
-    NUM_EDGES = 100  # arbitrary constant following the crater terrain
-
-    num_edges = (
-        int(NUM_EDGES * size[0] * granularity_multiplier),
-        int(NUM_EDGES * size[1] * granularity_multiplier),
-    )
+    num_edges = _num_edges(size, granularity_multiplier)
 
+    # Half the terrain is flat; only generate noise for the rugged half
+    midpoint = num_edges[0] // 2
     heights = rugged_heightmap(
         size=size,
         num_edges=num_edges,
         density=1.0,
+        roi=(slice(None), slice(midpoint, None)),
     )
 
     # Downscale the ruggedness to maintain overall flatness
     heights *= ruggedness
 
-    # Set half the terrain to be flat
-    midpoint = num_edges[0] // 2
-    heights[:, :midpoint] = 0
-
     return Terrain(
         static_geometry=[
             GeometryHeightmap(
@@ -206,28 +233,21 @@ def mixed_flat_rugged_one_thirds(
     :param granularity_multiplier: Multiplier for the number of edges used in the heightmap.
     :returns: The created terrain.
     """
-    NUM_EDGES = 100  # arbitrary constant following the crater terrain
-
-    num_edges = (
-        int(NUM_EDGES * size[0] * granularity_multiplier),
-        int(NUM_EDGES * size[1] * granularity_multiplier),
-    )
+    num_edges = _num_edges(size, granularity_multiplier)
 
+    # The first two-thirds of the terrain is perfectly flat; only generate
+    # noise for the rugged third along the width
+    rugged_start = num_edges[0] * 2 // 3
     heights = rugged_heightmap(
         size=size,
         num_edges=num_edges,
         density=1.0,
+        roi=(slice(None), slice(rugged_start, None)),
     )
 
     # Downscale the ruggedness to maintain overall flatness
     heights *= ruggedness
 
-    # Set 2/3 of the terrain to be perfectly flat
-    # Determine the start of the rugged third along the width
-    rugged_start = num_edges[0] * 2 // 3
-    # Set the first two-thirds of the heightmap to flat
-    heights[:, :rugged_start] = 0
-
     return Terrain(
         static_geometry=[
             GeometryHeightmap(
@@ -264,12 +284,7 @@ def crater(
     :param granularity_multiplier: Multiplier for how many edges are used in the heightmap.
     :returns: The created terrain.
     """
-    NUM_EDGES = 100  # arbitrary constant to get a nice number of edges
-
-    num_edges = (
-        int(NUM_EDGES * size[0] * granularity_multiplier),
-        int(NUM_EDGES * size[1] * granularity_multiplier),
-    )
+    num_edges = _num_edges(size, granularity_multiplier)
 
     rugged = rugged_heightmap(
         size=size,
@@ -280,10 +295,16 @@ def crater(
 
     max_height = ruggedness + curviness
     if max_height == 0.0:
-        heightmap = np.zeros(num_edges)
+        heightmap = np.zeros(num_edges, dtype=np.float32)
         max_height = 1.0
     else:
-        heightmap = (ruggedness * rugged + curviness * bowl) / (ruggedness + curviness)
+        # Blend the two heightmaps in place; both are fresh copies, and
+        # this avoids materializing a temporary per term of the weighted sum.
+        inv = 1.0 / (ruggedness + curviness)
+        rugged *= ruggedness * inv
+        bowl *= curviness * inv
+        rugged += bowl
+        heightmap = rugged
 
     return Terrain(
         static_geometry=[
@@ -302,7 +323,8 @@ def rugged_heightmap(
     size: tuple[float, float],
     num_edges: tuple[int, int],
     density: float = 1.0,
-) -> npt.NDArray[np.float_]:
+    roi: tuple[slice, slice] | None = None,
+) -> npt.NDArray[np.float32]:
     """
     Create a rugged terrain heightmap.
 
@@ -313,31 +335,129 @@ def rugged_heightmap(
     Be aware: the maximum height of the heightmap is not actually 1.
     It is around [-1,1] but not exactly.
 
+    Results are cached, so repeated calls with the same parameters
+    (the common case across evaluation batches) only pay for a copy.
+
     :param size: Size of the heightmap.
     :param num_edges: How many edges to use for the heightmap.
     :param density: How coarse the ruggedness is.
+    :param roi: Optional (rows, columns) slices to restrict noise generation to; the heightmap is zero outside this region.
     :returns: The created heightmap as a 2 dimensional array.
     """
-    OCTAVE = 10
-    C1 = 4.0  # arbitrary constant to get nice noise
-
-    return np.fromfunction(
-        np.vectorize(
-            lambda y, x: pnoise2(
-                x / num_edges[0] * C1 * size[0] * density,
-                y / num_edges[1] * C1 * size[1] * density,
-                OCTAVE,
-            ),
-            otypes=[float],
-        ),
-        num_edges,
-        dtype=float,
+    num_edges = (num_edges[0], num_edges[1])
+    # Slices are not hashable; normalize to (start, stop, step) for the cache key.
+    roi_key = (
+        None if roi is None else tuple(s.indices(n) for s, n in zip(roi, num_edges))
+    )
+    return _rugged_heightmap_cached(tuple(size), num_edges, density, roi_key).copy()
+
+
+@functools.lru_cache(maxsize=16)
+def _rugged_heightmap_cached(
+    size: tuple[float, float],
+    num_edges: tuple[int, int],
+    density: float,
+    roi: tuple[tuple[int, int, int], tuple[int, int, int]] | None,
+) -> npt.NDArray[np.float32]:
+    """
+    Generate a rugged heightmap and keep it for reuse.
+
+    The returned array is shared between calls and marked read-only;
+    callers must copy before mutating.
+
+    :param size: Size of the heightmap.
+    :param num_edges: How many edges to use for the heightmap.
+    :param density: How coarse the ruggedness is.
+    :param roi: Optional (rows, columns) index ranges to restrict noise generation to.
+    :returns: The created heightmap as a 2 dimensional array.
+    """
+    if roi is None:
+        roi = ((0, num_edges[0], 1), (0, num_edges[1], 1))
+    rows, cols = roi
+
+    kx = _C1 * size[0] * density / num_edges[0]
+    ky = _C1 * size[1] * density / num_edges[1]
+    if _perlin_numba is not None:
+        noise = _perlin_numba.perlin_grid(rows, cols, kx, ky, _OCTAVE)
+    else:
+        # Scaled sample coordinates as broadcastable row/column vectors;
+        # no need to materialize full index grids.
+        sx = np.arange(*cols, dtype=np.float32)[np.newaxis, :] * kx
+        sy = np.arange(*rows, dtype=np.float32)[:, np.newaxis] * ky
+        noise = perlin2d_grid(sx, sy, _OCTAVE)
+
+    if noise.shape == num_edges:
+        heights = noise
+    else:
+        heights = np.zeros(num_edges, dtype=np.float32)
+        heights[slice(*rows), slice(*cols)] = noise
+    heights.setflags(write=False)
+    return heights
+
+
+def spectral_heightmap(
+    num_edges: tuple[int, int],
+    beta: float = 2.0,
+    seed: int = 0,
+) -> npt.NDArray[np.float32]:
+    """
+    Create a rugged terrain heightmap through spectral synthesis.
+
+    White noise is shaped with a 1/f^beta power-law spectrum and
+    transformed back with an inverse FFT. This produces fractal
+    terrain similar in character to summed Perlin octaves, but in
+    O(N^2 log N) regardless of the octave count, so it scales better
+    to very fine grids. Heights are normalized to [-1, 1].
+
+    Results are cached, so repeated calls with the same parameters
+    only pay for a copy.
+
+    :param num_edges: How many edges to use for the heightmap.
+    :param beta: Spectral falloff; larger values give smoother terrain.
+    :param seed: Seed for the noise spectrum.
+    :returns: The created heightmap as a 2 dimensional array.
+    """
+    return _spectral_heightmap_cached(tuple(num_edges), beta, seed).copy()
+
+
+@functools.lru_cache(maxsize=16)
+def _spectral_heightmap_cached(
+    num_edges: tuple[int, int],
+    beta: float,
+    seed: int,
+) -> npt.NDArray[np.float32]:
+    """
+    Generate a spectral-synthesis heightmap and keep it for reuse.
+
+    The returned array is shared between calls and marked read-only;
+    callers must copy before mutating.
+
+    :param num_edges: How many edges to use for the heightmap.
+    :param beta: Spectral falloff; larger values give smoother terrain.
+    :param seed: Seed for the noise spectrum.
+    :returns: The created heightmap as a 2 dimensional array.
+    """
+    fy = np.fft.fftfreq(num_edges[0])[:, np.newaxis]
+    fx = np.fft.rfftfreq(num_edges[1])[np.newaxis, :]
+    f2 = fx * fx + fy * fy
+    f2[0, 0] = 1.0  # placeholder; the constant component is zeroed below
+
+    rng = np.random.default_rng(seed)
+    spectrum = rng.standard_normal((num_edges[0], fx.size)) + 1j * rng.standard_normal(
+        (num_edges[0], fx.size)
     )
+    spectrum *= f2 ** (-0.5 * beta)
+    spectrum[0, 0] = 0.0
+
+    heights = np.fft.irfft2(spectrum, s=num_edges).astype(np.float32)
+    heights /= np.abs(heights).max()
+    heights.setflags(write=False)
+    return heights
 
 
 def bowl_heightmap(
     num_edges: tuple[int, int],
-) -> npt.NDArray[np.float_]:
+) -> npt.NDArray[np.float32]:
     r"""
     Create a terrain heightmap in the shape of a bowl.
 
@@ -349,23 +469,36 @@ def bowl_heightmap(
 
     The height of the edges of the bowl is 1.0 and the center is 0.0.
 
+    Results are cached, so repeated calls with the same parameters
+    only pay for a copy.
+
     :param num_edges: How many edges to use for the heightmap.
     :returns: The created heightmap as a 2 dimensional array.
     """
-    return np.fromfunction(
-        np.vectorize(
-            lambda y, x: (
-                (x / num_edges[0] * 2.0 - 1.0) ** 2
-                + (y / num_edges[1] * 2.0 - 1.0) ** 2
-                if math.sqrt(
-                    (x / num_edges[0] * 2.0 - 1.0) ** 2
-                    + (y / num_edges[1] * 2.0 - 1.0) ** 2
-                )
-                <= 1.0
-                else 0.0
-            ),
-            otypes=[float],
-        ),
-        num_edges,
-        dtype=float,
-    )
+    return _bowl_heightmap_cached(tuple(num_edges)).copy()
+
+
+@functools.lru_cache(maxsize=16)
+def _bowl_heightmap_cached(
+    num_edges: tuple[int, int],
+) -> npt.NDArray[np.float32]:
+    """
+    Generate a bowl heightmap and keep it for reuse.
+
+    The returned array is shared between calls and marked read-only;
+    callers must copy before mutating.
+
+    :param num_edges: How many edges to use for the heightmap.
+    :returns: The created heightmap as a 2 dimensional array.
+    """
+    ix = np.arange(num_edges[1], dtype=np.float32)[np.newaxis, :]
+    iy = np.arange(num_edges[0], dtype=np.float32)[:, np.newaxis]
+    u = ix * (2.0 / num_edges[0]) - 1.0
+    v = iy * (2.0 / num_edges[1]) - 1.0
+    # The paraboloid u^2 + v^2, zeroed outside the unit circle.
+    # Comparing the squared radius against 1.0 makes the sqrt redundant.
+    # asarray does not copy here; it only restores the dtype for mypy.
+    heights: npt.NDArray[np.float32] = np.asarray(u * u + v * v, dtype=np.float32)
+    heights[heights > 1.0] = 0.0
+    heights.setflags(write=False)
+    return heights
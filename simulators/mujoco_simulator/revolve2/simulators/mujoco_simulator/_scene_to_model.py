@@ -1,9 +1,9 @@
 import os
 import tempfile
-from itertools import product
 from typing import Any
 
 import mujoco
+import numpy as np
 
 try:
     import logging
@@ -410,11 +410,13 @@ def _set_heightmap_values(
     heightmap_offset = 0
 
     for heightmap in heightmaps:
-        for x, y in product(
-            range(len(heightmap.heights)), range(len(heightmap.heights[0]))
-        ):
-            model.hfield_data[y * len(heightmap.heights) + x] = heightmap.heights[x][y]
-        heightmap_offset += len(heightmap.heights) * len(heightmap.heights[0])
+        # MuJoCo stores the field transposed relative to our heights array;
+        # one vectorized transpose-copy replaces the per-cell Python loop.
+        heights = np.asarray(heightmap.heights)
+        model.hfield_data[heightmap_offset : heightmap_offset + heights.size] = (
+            heights.T.ravel()
+        )
+        heightmap_offset += heights.size
 
 
 def _creat_sensor_maps(